@@ -161,21 +161,29 @@ const Bridge: React.FC = () => {
           strategy,
         );
 
-        const vizData = await loadVisualizationData(
+        // Start both loads before awaiting either so the base-case fetch
+        // overlaps the scenario fetch.
+        const vizLoad = loadVisualizationData(
           configName,
           params.highCPRAThreshold,
           strategy,
           { mode: 'bridge', surv: params.survivalMonths },
         );
+        const baseLoad = loadVisualizationData(
+          baseConfigName,
+          params.highCPRAThreshold,
+          strategy,
+          { mode: 'bridge', surv: params.survivalMonths },
+        );
+        // Observe a base failure here: if the scenario load throws, baseLoad
+        // is never awaited. When it is awaited, the error still reaches the
+        // catch below.
+        baseLoad.catch(() => null);
+        const vizData = await vizLoad;
 
         let baseVizData = null;
         try {
-          baseVizData = await loadVisualizationData(
-            baseConfigName,
-            params.highCPRAThreshold,
-            strategy,
-            { mode: 'bridge', surv: params.survivalMonths },
-          );
+          baseVizData = await baseLoad;
         } catch (err) {
           console.warn(
             `[Bridge] could not load base case (${baseConfigName}) for comparison:`,
@@ -94,6 +94,19 @@ const Index = () => {
       setError(null);
       
       try {
+        // Base case = the canonical N=0 config (no xeno; relist/death inert,
+        // deduped to 1p0/1p0 on the backend). composeConfigName enforces that.
+        // Its load is kicked off up front so it overlaps the scenario fetch
+        // instead of waiting behind it. The fetch is speculative: it is
+        // wasted when the scenario JSON names its own base (handled below).
+        const strategy = params.targetingStrategy || 'standard';
+        const canonicalBaseName = composeConfigName('replacement', { xeno_n: 0 }, strategy);
+        const canonicalBaseLoad = loadVisualizationData(canonicalBaseName, params.highCPRAThreshold, strategy);
+        // Observe a failure here: every early exit below (no config name, a
+        // scenario error, or a JSON-named base) leaves this promise
+        // un-awaited. When it is awaited, the error still reaches the catch.
+        canonicalBaseLoad.catch(() => null);
+
         // Find config name from user inputs
         const configName = await findConfigName({
           xeno_n: params.xeno_n,
@@ -110,24 +123,16 @@ const Index = () => {
         // Load visualization data
         const vizData = await loadVisualizationData(configName, params.highCPRAThreshold, params.targetingStrategy);
 
-        // Load base case data if comparison is available
+        // Load base case data if comparison is available. The viz JSON may
+        // name its own base; only then is a second base fetch needed.
         let baseVizData = null;
-        let baseConfigName = vizData.base_config_name;
-
-        // Base case = the canonical N=0 config (no xeno; relist/death inert,
-        // deduped to 1p0/1p0 on the backend). composeConfigName enforces that.
-        const strategy = params.targetingStrategy || 'standard';
-        if (!baseConfigName) {
-          baseConfigName = composeConfigName('replacement', { xeno_n: 0 }, strategy);
-        }
-
-        // Try to load base case - always attempt if we have a config name
-        if (baseConfigName) {
-          try {
-            baseVizData = await loadVisualizationData(baseConfigName, params.highCPRAThreshold, strategy);
-          } catch (err) {
-            console.warn(`Could not load base case data (${baseConfigName}) for comparison:`, err);
-          }
+        const baseConfigName = vizData.base_config_name || canonicalBaseName;
+        try {
+          baseVizData = await (baseConfigName === canonicalBaseName
+            ? canonicalBaseLoad
+            : loadVisualizationData(baseConfigName, params.highCPRAThreshold, strategy));
+        } catch (err) {
+          console.warn(`Could not load base case data (${baseConfigName}) for comparison:`, err);
         }
 
         // Transform to simulation data format
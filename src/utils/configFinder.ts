@@ -120,7 +120,12 @@ interface ExperimentConfigs {
 
 
 
-import { supplyToken } from './supplyGrid';
+import {
+  CPRA_THRESHOLDS,
+  STRATEGIES,
+  supplyPoints,
+  supplyToken,
+} from './supplyGrid';
 
 // Supabase Storage base URL. Supplied ONLY at build time via the env var
 // VITE_SUPABASE_STORAGE_URL — nothing is hardcoded here. Set it in .env /
@@ -321,6 +326,14 @@ function bridgeVizFolder(strategy: string, threshold: number, surv: BridgeSurviv
     : `viz_data_age_bridge_targeting_${suf}`;
 }
 
+// Parsed registries keyed by URL, for the dev-time membership check in
+// findConfigName. That check only runs under `import.meta.env.DEV`, so this
+// cache is dev-only: production builds never fetch a registry at all. In dev
+// it keeps the whole-registry download off every slider move. The registry
+// is only informational, so a session-stale copy is fine. Failed fetches are
+// not cached.
+const registryCache = new Map<string, ExperimentConfigs>();
+
 // Find config name from user inputs
 export async function findConfigName(userInputs: UserInputs): Promise<string | null> {
   try {
@@ -373,13 +386,19 @@ export async function findConfigName(userInputs: UserInputs): Promise<string | n
     // missing registry never breaks the UI.
     if (import.meta.env.DEV) {
       try {
-        const r = await fetch(configUrl);
-        if (r.ok) {
-          const reg: ExperimentConfigs = await r.json();
+        let reg = registryCache.get(configUrl);
+        if (!reg) {
+          const r = await fetch(configUrl);
+          if (r.ok) {
+            reg = (await r.json()) as ExperimentConfigs;
+            registryCache.set(configUrl, reg);
+          } else {
+            console.log(`[Config Finder] registry fetch returned HTTP ${r.status} (informational only)`);
+          }
+        }
+        if (reg) {
           const present = !!reg.name_to_config?.[configName];
           console.log(`[Config Finder] registry membership check (informational): ${present ? '✓ in registry' : '✗ not in registry yet — will still attempt fetch'}`);
-        } else {
-          console.log(`[Config Finder] registry fetch returned HTTP ${r.status} (informational only)`);
         }
       } catch {
         /* ignore */
@@ -506,29 +525,131 @@ export interface LoadVizOptions {
   surv?: BridgeSurvivalMonths; // required when mode === 'bridge'
 }
 
-export async function loadVisualizationData(
+// Recently used viz JSONs, keyed by primary URL. The same JSON is requested
+// over and over — the n0 base case on every slider move, and once per point
+// by every Pareto sweep — and each one is a few MB to download and parse.
+// Storing the in-flight promise (not the resolved value) also dedupes
+// concurrent loads of the same config. Failed loads and loads served from
+// the pre-rerun backup are evicted so a retry (e.g. once a re-run lands)
+// refetches the live prefix.
+//
+// Bounded as an LRU: a Map iterates in insertion order, so a hit is moved to
+// the back and the oldest SETTLED entry is dropped once the cache is over
+// capacity. In-flight loads are never evicted, so concurrent requests for a
+// config always share one fetch.
+//
+// The bound has to cover a page's whole overlay working set. Each sweep
+// requests its configs in the same order every time, and a repeated scan
+// larger than an LRU evicts exactly the entry the next request needs — every
+// point would miss on every re-sweep. The largest set is one supply sweep
+// across a full overlay (scenarios + n0 bases), plus the page's second sweep
+// (Replacement: strategies × relist multipliers; Bridge: strategies ×
+// survivals × {scenario, base}), plus the page's own scenario/base pair.
+function overlayWorkingSetSize(): number {
+  const strategiesOverlay = Math.max(
+    ...CPRA_THRESHOLDS.map((thr) =>
+      STRATEGIES.reduce((n, s) => n + supplyPoints(s, thr).length, 0),
+    ),
+  );
+  const thresholdsOverlay = Math.max(
+    ...STRATEGIES.map((s) =>
+      CPRA_THRESHOLDS.reduce((n, thr) => n + supplyPoints(s, thr).length, 0),
+    ),
+  );
+  const secondSweep = STRATEGIES.length * Math.max(
+    XENO_RELIST_MULTIPLIERS.length,
+    2 * BRIDGE_SURVIVAL_MONTHS.length,
+  );
+  return Math.max(strategiesOverlay, thresholdsOverlay) + secondSweep + 2;
+}
+
+export const VIZ_CACHE_MAX_ENTRIES = overlayWorkingSetSize();
+
+interface VizCacheEntry {
+  promise: Promise<any>;
+  settled: boolean;
+}
+const vizDataCache = new Map<string, VizCacheEntry>();
+
+// Drop every cached viz JSON. Exposed for tests that stub `fetch`.
+export function clearVisualizationDataCache(): void {
+  vizDataCache.clear();
+}
+
+function evictSettledVizEntries(): void {
+  for (const [url, entry] of vizDataCache) {
+    if (vizDataCache.size <= VIZ_CACHE_MAX_ENTRIES) return;
+    if (entry.settled) vizDataCache.delete(url);
+  }
+}
+
+export function loadVisualizationData(
   configName: string,
   highCPRAThreshold: number = 95,
   targetingStrategy?: string,
   opts: LoadVizOptions = {},
-) {
+): Promise<any> {
   const mode: TherapyMode = opts.mode || 'replacement';
   const strategy = targetingStrategy || 'standard';
-  const { primaryUrl, backupUrl, vizFolder } = resolveVizUrls(
-    configName, mode, highCPRAThreshold, strategy, opts.surv,
-  );
+  let urls: ReturnType<typeof resolveVizUrls>;
+  try {
+    urls = resolveVizUrls(configName, mode, highCPRAThreshold, strategy, opts.surv);
+  } catch (error) {
+    return Promise.reject(error);
+  }
+  const { primaryUrl, backupUrl } = urls;
+
+  const cached = vizDataCache.get(primaryUrl);
+  if (cached) {
+    vizDataCache.delete(primaryUrl);
+    vizDataCache.set(primaryUrl, cached);
+    return cached.promise;
+  }
+
+  // A load served from the pre-rerun backup is handed to its callers but
+  // not kept: the fresh JSON can land at the live prefix at any point during
+  // the re-run, and the next load must go back to the live prefix first.
+  const entry: VizCacheEntry = {
+    promise: fetchVisualizationData(
+      configName, primaryUrl, backupUrl, highCPRAThreshold, mode, opts.surv,
+    ).then(({ data, fromBackup }) => {
+      entry.settled = true;
+      if (fromBackup && vizDataCache.get(primaryUrl) === entry) {
+        vizDataCache.delete(primaryUrl);
+      }
+      evictSettledVizEntries();
+      return data;
+    }),
+    settled: false,
+  };
+  vizDataCache.set(primaryUrl, entry);
+  evictSettledVizEntries();
+  entry.promise.catch(() => {
+    entry.settled = true;
+    if (vizDataCache.get(primaryUrl) === entry) vizDataCache.delete(primaryUrl);
+  });
+  return entry.promise;
+}
 
+async function fetchVisualizationData(
+  configName: string,
+  primaryUrl: string,
+  backupUrl: string | null,
+  highCPRAThreshold: number,
+  mode: TherapyMode,
+  surv?: BridgeSurvivalMonths,
+): Promise<{ data: any; fromBackup: boolean }> {
   // Try the primary (live) prefix first; fall back to the pre-rerun backup
   // if the new viz hasn't landed yet for this config (replacement mode
   // only — bridge has no pre-rerun backup).
   try {
-    console.log(`[Config Finder] Loading viz data from: ${primaryUrl} (cPRA ${highCPRAThreshold}%${mode === 'bridge' ? `, surv ${opts.surv}mo` : ''})`);
+    console.log(`[Config Finder] Loading viz data from: ${primaryUrl} (cPRA ${highCPRAThreshold}%${mode === 'bridge' ? `, surv ${surv}mo` : ''})`);
     const response = await fetch(primaryUrl);
     if (response.ok) {
       const data = await response.json();
       console.log('[Config Finder] ✓ loaded fresh viz data:', configName, `(cPRA ${highCPRAThreshold}%, mode=${mode})`,
                   'Series count:', data.waitlist_sizes?.series?.length);
-      return data;
+      return { data, fromBackup: false };
     }
     // Supabase Storage's PUBLIC endpoint returns HTTP 400 (with a JSON
     // body containing "not_found") when an object doesn't exist —
@@ -544,14 +665,14 @@ export async function loadVisualizationData(
       if (backupResp.ok) {
         const data = await backupResp.json();
         console.log('[Config Finder] ✓ loaded BACKUP viz data (re-run not finished for this config):', configName);
-        return data;
+        return { data, fromBackup: true };
       }
     } else {
       console.log(`[Config Finder] primary missing (HTTP ${response.status}); no backup configured for mode=${mode}`);
     }
 
     throw new Error(
-      `Visualization data for ${configName} (cPRA ${highCPRAThreshold}%${mode === 'bridge' ? `, surv ${opts.surv}mo` : ''}) is not yet available — re-run in progress.`
+      `Visualization data for ${configName} (cPRA ${highCPRAThreshold}%${mode === 'bridge' ? `, surv ${surv}mo` : ''}) is not yet available — re-run in progress.`
     );
   } catch (error) {
     console.error('Error loading visualization data:', error);
@@ -25,6 +25,19 @@ import {
   loadParetoDataset,
   type ParetoPointSpec,
 } from './pareto';
+import {
+  clearVisualizationDataCache,
+  loadVisualizationData,
+  VIZ_CACHE_MAX_ENTRIES,
+} from './configFinder';
+import { computeWaitTimeByYear } from './dataTransformer';
+
+// Wrap the real computeWaitTimeByYear in a spy so the wait-time memo in
+// pareto.ts can be observed; every call still runs the actual transformer.
+vi.mock('./dataTransformer', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('./dataTransformer')>();
+  return { ...actual, computeWaitTimeByYear: vi.fn(actual.computeWaitTimeByYear) };
+});
 
 describe('kneedle', () => {
   it('returns null for empty / mismatched / too-short inputs', () => {
@@ -373,6 +386,18 @@ describe('wait-time extractors (Little\'s Law)', () => {
     expect(reduction!).toBeCloseTo(0, 6);
   });
 
+  it('waitTimeReductionFromViz computes the shared base once across a sweep', () => {
+    const spy = vi.mocked(computeWaitTimeByYear);
+    spy.mockClear();
+    const base = buildWtViz({ txPerYear: 100 });
+    const first = waitTimeReductionFromViz(buildWtViz({ txPerYear: 200 }) as any, base as any, 3, 95);
+    const second = waitTimeReductionFromViz(buildWtViz({ txPerYear: 300 }) as any, base as any, 3, 95);
+    expect(first).not.toBeNull();
+    expect(second!).toBeGreaterThan(first!);
+    // Two scenarios + one base: the second call reuses the base's rows.
+    expect(spy).toHaveBeenCalledTimes(3);
+  });
+
   it('threshold parameter actually flows through to wl_removal lookup (95 vs 99 give different Ŵ)', () => {
     // Same viz, two different thresholds → different wl_removal rates →
     // different outflow → different Ŵ. The 99% high-cPRA wl_removal
@@ -463,6 +488,8 @@ describe('loadParetoDataset', () => {
   let fetchSpy: ReturnType<typeof vi.spyOn>;
 
   beforeEach(() => {
+    // Each test stubs its own responses, so start from a cold viz cache.
+    clearVisualizationDataCache();
     // Minimal viz: deaths_per_year + waitlist_sizes built from a per-prop
     // scaling factor extracted from the URL.
     fetchSpy = vi.spyOn(global, 'fetch').mockImplementation(async (input) => {
@@ -533,6 +560,29 @@ describe('loadParetoDataset', () => {
     expect(ds.points.map((p) => p.y)).toEqual([200, 300, 350, 375]);
   });
 
+  it('fetches the shared base case once per sweep', async () => {
+    const points: ParetoPointSpec[] = [
+      { label: '250/yr', x: 250, xeno_n: 250, surv: 12 },
+      { label: '500/yr', x: 500, xeno_n: 500, surv: 12 },
+      { label: '750/yr', x: 750, xeno_n: 750, surv: 12 },
+    ];
+    const opts = {
+      mode: 'bridge' as const,
+      highCPRAThreshold: 95,
+      strategy: 'standard',
+      targetYear: 10,
+      metric: livesSavedFromViz,
+      points,
+    };
+    await loadParetoDataset(opts);
+    // 3 scenarios + 1 base (n0 is deduped across points while in flight).
+    expect(fetchSpy).toHaveBeenCalledTimes(4);
+
+    // A second sweep over the same configs is served entirely from cache.
+    await loadParetoDataset(opts);
+    expect(fetchSpy).toHaveBeenCalledTimes(4);
+  });
+
   it('drops failed-to-load points and still returns the rest', async () => {
     fetchSpy.mockImplementationOnce(async () => new Response('', { status: 500 }));
     const points: ParetoPointSpec[] = [
@@ -553,6 +603,139 @@ describe('loadParetoDataset', () => {
     expect(ds.points.length).toBeLessThanOrEqual(2);
   });
 
+  it('evicts the least recently used viz once the cache is full', async () => {
+    const cap = VIZ_CACHE_MAX_ENTRIES;
+    const load = (n: number) =>
+      loadVisualizationData(`xeno_age_n${n}_relist1p0_death1p0`, 95, 'standard', {
+        mode: 'bridge',
+        surv: 12,
+      });
+    for (let n = 1; n <= cap; n += 1) await load(n);
+    await load(1); // touch n1 so n2 is now the oldest entry
+    await load(cap + 1); // over capacity → n2 dropped
+    expect(fetchSpy).toHaveBeenCalledTimes(cap + 1);
+
+    await load(1);
+    expect(fetchSpy).toHaveBeenCalledTimes(cap + 1);
+    await load(2);
+    expect(fetchSpy).toHaveBeenCalledTimes(cap + 2);
+  });
+
+  it('holds a full overlay working set across back-to-back sweeps', async () => {
+    // 40 scenarios + 1 shared base: larger than the old 32-entry bound,
+    // which made every point of a repeated sequential sweep miss.
+    const points: ParetoPointSpec[] = Array.from({ length: 40 }, (_, i) => ({
+      label: `${i + 1}`,
+      x: i + 1,
+      xeno_n: i + 1,
+      surv: 12,
+    }));
+    const opts = {
+      mode: 'bridge' as const,
+      highCPRAThreshold: 95,
+      strategy: 'standard',
+      targetYear: 10,
+      metric: livesSavedFromViz,
+      points,
+    };
+    expect(VIZ_CACHE_MAX_ENTRIES).toBeGreaterThanOrEqual(41);
+    await loadParetoDataset(opts);
+    expect(fetchSpy).toHaveBeenCalledTimes(41);
+
+    await loadParetoDataset(opts);
+    expect(fetchSpy).toHaveBeenCalledTimes(41);
+  });
+
+  it('never evicts a load that is still in flight', async () => {
+    const cap = VIZ_CACHE_MAX_ENTRIES;
+    const load = (n: number) =>
+      loadVisualizationData(`xeno_age_n${n}_relist1p0_death1p0`, 95, 'standard', {
+        mode: 'bridge',
+        surv: 12,
+      });
+    // Start cap + 5 loads without awaiting: all are pending at once, so
+    // none may be dropped and repeats must share the in-flight fetch.
+    const first = Array.from({ length: cap + 5 }, (_, i) => load(i + 1));
+    const again = Array.from({ length: cap + 5 }, (_, i) => load(i + 1));
+    await Promise.all([...first, ...again]);
+    expect(fetchSpy).toHaveBeenCalledTimes(cap + 5);
+  });
+
+  it('does not cache loads served from the pre-rerun backup', async () => {
+    const urls: string[] = [];
+    let primaryLanded = false;
+    fetchSpy.mockImplementation(async (input) => {
+      const url = String(input);
+      urls.push(url);
+      // Supabase reports a missing object as HTTP 400, not 404.
+      if (!url.includes('_backup_pre_rerun_') && !primaryLanded) {
+        return new Response('{"error":"not_found"}', { status: 400 });
+      }
+      return new Response(
+        JSON.stringify({ source: url.includes('_backup_pre_rerun_') ? 'backup' : 'live' }),
+        { status: 200 },
+      );
+    });
+    const load = () =>
+      loadVisualizationData('xeno_age_n1000_relist1p0_death1p0', 95, 'standard');
+
+    expect(await load()).toEqual({ source: 'backup' });
+    expect(urls).toHaveLength(2);
+
+    // The re-run lands: the next load must go back to the live prefix.
+    primaryLanded = true;
+    expect(await load()).toEqual({ source: 'live' });
+    expect(urls).toHaveLength(3);
+    expect(urls[2]).not.toContain('_backup_pre_rerun_');
+
+    // Live hits are cached as usual.
+    expect(await load()).toEqual({ source: 'live' });
+    expect(urls).toHaveLength(3);
+  });
+
+  it('does not cache failed loads', async () => {
+    fetchSpy.mockImplementationOnce(async () => new Response('', { status: 500 }));
+    const opts = {
+      mode: 'bridge' as const,
+      highCPRAThreshold: 95,
+      strategy: 'standard',
+      targetYear: 10,
+      metric: livesSavedFromViz,
+      points: [{ label: '250/yr', x: 250, xeno_n: 250, surv: 12 }] as ParetoPointSpec[],
+    };
+    expect((await loadParetoDataset(opts)).points).toHaveLength(0);
+    // The failed scenario is refetched; the base case comes from cache.
+    expect((await loadParetoDataset(opts)).points).toHaveLength(1);
+    expect(fetchSpy).toHaveBeenCalledTimes(3);
+  });
+
+  it('retries the shared base once so one failed n0 fetch does not empty the curve', async () => {
+    const defaultImpl = fetchSpy.getMockImplementation()!;
+    let baseCalls = 0;
+    fetchSpy.mockImplementation(async (input) => {
+      if (String(input).includes('_n0_')) {
+        baseCalls += 1;
+        if (baseCalls === 1) return new Response('', { status: 500 });
+      }
+      return defaultImpl(input);
+    });
+    const ds = await loadParetoDataset({
+      mode: 'bridge',
+      highCPRAThreshold: 95,
+      strategy: 'standard',
+      targetYear: 10,
+      metric: livesSavedFromViz,
+      points: [
+        { label: '250/yr', x: 250, xeno_n: 250, surv: 12 },
+        { label: '500/yr', x: 500, xeno_n: 500, surv: 12 },
+        { label: '750/yr', x: 750, xeno_n: 750, surv: 12 },
+      ],
+    });
+    expect(ds.points.map((p) => p.y)).toEqual([200, 300, 350]);
+    // One failed base fetch + one shared retry.
+    expect(baseCalls).toBe(2);
+  });
+
   it('returns empty dataset (no inflection) when fewer than 2 points succeed', async () => {
     fetchSpy.mockImplementation(async () => new Response('', { status: 500 }));
     const ds = await loadParetoDataset({
@@ -88,8 +88,27 @@ function totalSeries(chart: ChartLike | undefined): { y: number[] } | null {
 
   // Some series use `y`, others `values` (e.g. deaths_per_year). Both are
   // already in chronological order matching `chart.x` / `chart.year_labels`.
-  const y = totalCandidate.y ?? totalCandidate.values ?? [];
-  return { y: [...y] };
+  // Returned by reference: callers only read it, and the viz JSONs are
+  // shared through the load cache, so a per-call copy is pure overhead.
+  return { y: totalCandidate.y ?? totalCandidate.values ?? [] };
+}
+
+/**
+ * Index `i` of the first grid point at or past `target`, so that
+ * `xs[i - 1] < target <= xs[i]`. Callers clamp out-of-range targets first,
+ * which guarantees 1 ≤ i ≤ xs.length − 1. Binary search over the ascending
+ * time grid (up to ~3650 daily samples) instead of a linear scan, since
+ * every Pareto point interpolates several charts on both scenario and base.
+ */
+function bracketIndex(xs: number[], target: number): number {
+  let lo = 1;
+  let hi = xs.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (xs[mid] >= target) hi = mid;
+    else lo = mid + 1;
+  }
+  return lo;
 }
 
 /**
@@ -108,32 +127,27 @@ function valueAtYear(chart: ChartLike | undefined, targetYear: number): number |
 
   // The waitlist / cumulative-deaths charts have x in DAYS; deaths_per_year
   // / net_deaths_prevented have year_labels in YEARS. Detect which by max:
-  // anything > 50 is days (10y horizon = 3650).
+  // anything > 50 is days (10y horizon = 3650). Scale the one target into
+  // the grid's units rather than allocating a years copy of the whole grid.
   const maxX = xs[xs.length - 1];
-  const xsYears = maxX > 50 ? xs.map((d) => d / 365) : xs;
+  const target = maxX > 50 ? targetYear * 365 : targetYear;
   const yArr = totals.y;
-  if (yArr.length !== xsYears.length) {
+  if (yArr.length !== xs.length) {
     // Mismatched lengths shouldn't happen but bail safely if they do.
     return yArr[yArr.length - 1] ?? null;
   }
 
-  if (targetYear <= xsYears[0]) return yArr[0];
-  if (targetYear >= xsYears[xsYears.length - 1]) return yArr[yArr.length - 1];
-
-  // Linear search is fine for ≤ ~3650 points. Could binary-search but
-  // YAGNI.
-  for (let i = 1; i < xsYears.length; i += 1) {
-    if (xsYears[i] >= targetYear) {
-      const x0 = xsYears[i - 1];
-      const x1 = xsYears[i];
-      const y0 = yArr[i - 1];
-      const y1 = yArr[i];
-      if (x1 === x0) return y1;
-      const t = (targetYear - x0) / (x1 - x0);
-      return y0 + t * (y1 - y0);
-    }
-  }
-  return yArr[yArr.length - 1];
+  if (target <= xs[0]) return yArr[0];
+  if (target >= xs[xs.length - 1]) return yArr[yArr.length - 1];
+
+  const i = bracketIndex(xs, target);
+  const x0 = xs[i - 1];
+  const x1 = xs[i];
+  const y0 = yArr[i - 1];
+  const y1 = yArr[i];
+  if (x1 === x0) return y1;
+  const t = (target - x0) / (x1 - x0);
+  return y0 + t * (y1 - y0);
 }
 
 /**
@@ -160,22 +174,17 @@ function seAtYear(
     (chart.year_labels?.map((l) => Number(l)) as number[] | undefined);
   if (!xs?.length || xs.length !== std.length) return null;
   const maxX = xs[xs.length - 1];
-  const xsYears = maxX > 50 ? xs.map((d) => d / 365) : xs;
+  const target = maxX > 50 ? targetYear * 365 : targetYear;
 
   // Interpolate the SD to the target year (mirrors valueAtYear).
   let sd: number;
-  if (targetYear <= xsYears[0]) sd = std[0];
-  else if (targetYear >= xsYears[xsYears.length - 1]) sd = std[std.length - 1];
+  if (target <= xs[0]) sd = std[0];
+  else if (target >= xs[xs.length - 1]) sd = std[std.length - 1];
   else {
-    sd = std[std.length - 1];
-    for (let i = 1; i < xsYears.length; i += 1) {
-      if (xsYears[i] >= targetYear) {
-        const x0 = xsYears[i - 1], x1 = xsYears[i];
-        const t = x1 === x0 ? 0 : (targetYear - x0) / (x1 - x0);
-        sd = std[i - 1] + t * (std[i] - std[i - 1]);
-        break;
-      }
-    }
+    const i = bracketIndex(xs, target);
+    const x0 = xs[i - 1], x1 = xs[i];
+    const t = x1 === x0 ? 0 : (target - x0) / (x1 - x0);
+    sd = std[i - 1] + t * (std[i] - std[i - 1]);
   }
   return sd / Math.sqrt(numExperiments);
 }
@@ -331,6 +340,18 @@ export function waitlistReductionFromViz(
 // only way to guarantee that is for both surfaces to call the same
 // transformer with the same wlRemovalRates.
 
+// Wait-time rows per (viz JSON, threshold). The rows depend only on the viz
+// and the threshold's removal rates, and every point of a sweep evaluates
+// the SAME base-case viz object (shared through loadVisualizationData's
+// cache), so memoizing on the object runs the base's Little's-Law pass once
+// per sweep instead of once per point. Keyed weakly, so a memo entry lives
+// only as long as something (the bounded viz LRU, or a caller) still holds
+// its viz object.
+const waitTimeRowsCache = new WeakMap<
+  VizLike,
+  Map<number, ReturnType<typeof computeWaitTimeByYear>>
+>();
+
 /**
  * Wait time at the requested year (months), computed from the viz JSON via
  * Little's Law (W = L / outflow), with `outflow = transplants + waitlist
@@ -356,11 +377,20 @@ export function waitTimeAtYearFromViz(
   // on the viz, but only uses it for the wlRemovalRates lookup which we
   // do explicitly here. Fill it in defensively so a future signature
   // tightening doesn't silently break this caller.
-  const wlRemovalRates = getWlRemovalRates(highCPRAThreshold);
-  const enriched = { ...viz, highCPRAThreshold } as Parameters<
-    typeof computeWaitTimeByYear
-  >[0];
-  const rows = computeWaitTimeByYear(enriched, { wlRemovalRates });
+  let byThreshold = waitTimeRowsCache.get(viz);
+  if (!byThreshold) {
+    byThreshold = new Map();
+    waitTimeRowsCache.set(viz, byThreshold);
+  }
+  let rows = byThreshold.get(highCPRAThreshold);
+  if (rows === undefined) {
+    const wlRemovalRates = getWlRemovalRates(highCPRAThreshold);
+    const enriched = { ...viz, highCPRAThreshold } as Parameters<
+      typeof computeWaitTimeByYear
+    >[0];
+    rows = computeWaitTimeByYear(enriched, { wlRemovalRates });
+    byThreshold.set(highCPRAThreshold, rows);
+  }
   if (!rows || rows.length === 0) return null;
 
   // Use dialysis-only wait (W_C, L = C) to match the WaitTimeChart's
@@ -769,15 +799,22 @@ export async function loadParetoDataset(opts: LoadParetoOptions): Promise<Pareto
         effectiveStrategy,
       );
 
-      const [scenarioViz, baseViz] = await Promise.all([
-        loadVisualizationData(scenarioName, highCPRAThreshold, effectiveStrategy, {
+      // Every point shares one in-flight base load through the viz cache,
+      // so a single transient failure there would drop the whole curve, not
+      // just one point. Retry it once: the failed entry is evicted before
+      // this handler runs, so the retry refetches, and the points retrying
+      // together share that one retry.
+      const loadBase = () =>
+        loadVisualizationData(baseName, highCPRAThreshold, effectiveStrategy, {
           mode,
           surv: spec.surv,
-        }),
-        loadVisualizationData(baseName, highCPRAThreshold, effectiveStrategy, {
+        });
+      const [scenarioViz, baseViz] = await Promise.all([
+        loadVisualizationData(scenarioName, highCPRAThreshold, effectiveStrategy, {
           mode,
           surv: spec.surv,
         }),
+        loadBase().catch(() => loadBase()),
       ]);
 
       const y = metric(scenarioViz as VizLike, baseViz as VizLike, targetYear);